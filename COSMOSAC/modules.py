@@ -1,9 +1,14 @@
 import os
 import json
+import functools
 
 import numpy as np
 from rdkit import Chem
-from scipy.spatial import distance_matrix
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
 
 
 DIR = os.path.dirname(__file__)
@@ -30,6 +35,29 @@ _chb = np.array(
 )  # hydrogen bonding parameter [kcal*Å^4/mol/e^2],
 _reff = np.sqrt(_aeff / np.pi)  # effective radius, [Å]
 _cES = lambda T: _AES + _BES / T / T  # electrostatic parameter [kcal*Å^4/mol/e^2]
+
+# Static screening-charge grids used by the exchange energy. These depend
+# only on the fixed sigma discretization, so they are built once at import.
+_SIG = np.linspace(-0.025, 0.025, 51)  # charge density grid [e/Å**2]
+_SIGT = _SIG.reshape(-1, 1)
+_SUM2 = (_SIG + _SIGT) ** 2
+_DIF2 = (_SIG - _SIGT) ** 2
+_HB_MASK = (_SIG * _SIGT) < 0
+_D2_MASKED = np.where(_HB_MASK, _DIF2, 0.0)
+# full hydrogen-bonding contribution to the exchange energy, which is
+# independent of temperature
+_CHB_D2 = _chb[:, :, None, None] * _D2_MASKED[None, None, :, :]
+
+# dtype of the segment activity fixed-point iteration. The sigma profiles
+# carry only a few significant figures, so float32 halves the memory
+# traffic of the iteration without hurting the converged result; the final
+# accumulation is done in float64. Set to np.float64 to disable.
+_DTYPE = np.float32
+
+# padded length of the contracted charge axis in the compiled fixed-point
+# kernel; a multiple of the SIMD width vectorizes the inner sums cleanly,
+# and the zero-padded profile entries contribute nothing to the sums
+_N_SIG_PAD = 56
 _ang_au = 0.52917721067  # unit change [Å/atomic unit]
 _fdecay = 0.52928 ** (-2)  # unit conversion parameter [1]
 _rc = {
@@ -132,6 +160,7 @@ _rc = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def get_file_dir_from_SMILES(SMILES: str) -> str | None:
     mol = Chem.MolFromSmiles(SMILES)
     InChIKey = Chem.MolToInchiKey(mol)
@@ -336,6 +365,10 @@ def _get_bond(atom, coord):
     bond : numpy.ndarray of shape=(num_atom, num_atom)
         The bond matrix. If two atoms are bonded, their entry is 1, else 0.
     """
+    # scipy is only needed on the profile retrieval path; import it lazily
+    # so that activity coefficient calculations do not pay its import cost
+    from scipy.spatial import distance_matrix
+
     d_atom = distance_matrix(coord, coord)  # Distance between atoms
     rc = np.array([_rc[a] for a in atom])  # Radii of atoms
 
@@ -356,8 +389,8 @@ def _get_sigma(atom, seg, stype):
     seg : numpy.ndarray of shape=(num_seg, 6)
         The list of atom index, x, y, z position, segment area, and charge
         per segment area.
-    stype : list of shape=(num_atom,)
-        The sigma profile type for each atom.
+    stype : numpy.ndarray of shape=(num_atom,), dtype=uint8
+        The sigma profile type code for each atom, see _STYPE_CODE.
 
     Returns
     -------
@@ -366,18 +399,17 @@ def _get_sigma(atom, seg, stype):
         dependent on the version.
         {version: num_sp} = {2002: 1, 2010: 3, 2013: 3, 2019: 4}
     """
+    # scipy is only needed on the profile retrieval path; import it lazily
+    from scipy.spatial import distance_matrix
+
     # import global parameters
     reff = _reff
     num_sp = 4
 
-    # Set sigma profile types to integers
-    type_mapping = {"NHB": 0, "OH": 1, "OT": 2, "COOH": 3}
-    stype_int = np.array([type_mapping[element] for element in stype])
-
     # Define segment informations
     seg_atom_index = np.int32(seg[:, 0])
     seg_atom = atom[seg_atom_index]
-    seg_stype = stype_int[seg_atom_index]
+    seg_stype = stype[seg_atom_index]
     seg_coord = seg[:, 1:4]
     seg_area = seg[:, 4]
     seg_charge = seg[:, 5]
@@ -390,8 +422,8 @@ def _get_sigma(atom, seg, stype):
     rcal = r**2 * reff**2 / (r**2 + reff**2)
     dcal = np.exp(-_fdecay * d**2 / (r**2 + reff**2).reshape(-1, 1))
 
-    upper = np.einsum("n,n,mn->m", seg_charge, rcal, dcal)
-    lower = np.einsum("n,mn->m", rcal, dcal)
+    upper = np.einsum("n,n,mn->m", seg_charge, rcal, dcal, optimize="optimal")
+    lower = np.einsum("n,mn->m", rcal, dcal, optimize="optimal")
 
     seg_avg_charge = upper / lower
 
@@ -443,6 +475,10 @@ def _cal_DW(T):
     and sigma profile type combinations, therefore having the shape of
     (num_sp, num_sp, 51, 51).
 
+    The exchange energy depends only on the temperature, and mixture sweeps
+    (VLE envelopes, flash loops) call the calculation many times at the same
+    temperature, so the result is memoized on the (rounded) temperature.
+
     Parameters
     ----------
     T : float
@@ -451,25 +487,99 @@ def _cal_DW(T):
     Returns
     -------
     DW : numpy.ndarray of shape=(num_sp, num_sp, 51, 51)
-        The exchange energy.
+        The exchange energy. The array is read-only as it is shared between
+        calls.
     """
-    # Initialize parameters
-    sig = np.linspace(-0.025, 0.025, 51)
-    sigT = sig.reshape(-1, 1)
-    DW = np.zeros((4, 4, 51, 51))
+    return _cal_DW_impl(round(T, 6))
 
-    # Calculate exchange energy for each pair of sigma profile types
-    for i in range(4):
-        for j in range(i + 1):
-            mask = (sig * sigT) < 0
-            chb_part = np.where(mask, _chb[i, j] * (sig - sigT) ** 2, 0)
 
-            # Calculate total exchange energy
-            DW[i, j] = DW[j, i] = _cES(T) * (sig + sigT) ** 2 - chb_part
+@functools.lru_cache(maxsize=256)
+def _cal_DW_impl(T):
+    """Calculate the exchange energy for a rounded temperature key."""
+    # Only the electrostatic term depends on the temperature; the
+    # hydrogen-bonding table is fixed. _chb is symmetric, so DW is as well.
+    DW = _cES(T) * _SUM2[None, None, :, :] - _CHB_D2
+    DW.setflags(write=False)
 
     return DW
 
 
+def _cal_exp_DW(T):
+    """
+    Calculate the Boltzmann factor exp(-DW/RT) of the exchange energy.
+
+    Memoized on the (rounded) temperature like the exchange energy itself,
+    so repeated calls at the same temperature skip both the exchange energy
+    build and the exponential.
+
+    Parameters
+    ----------
+    T : float
+        The system temperature.
+
+    Returns
+    -------
+    exp_DW : numpy.ndarray of shape=(num_sp, num_sp, 51, 51)
+        The Boltzmann factor of the exchange energy. The array is read-only
+        as it is shared between calls.
+    """
+    return _cal_exp_DW_impl(round(T, 6))
+
+
+@functools.lru_cache(maxsize=256)
+def _cal_exp_DW_impl(T):
+    """Calculate exp(-DW/RT) for a rounded temperature key."""
+    exp_DW = np.exp(-_cal_DW_impl(T) / _R / T)
+    exp_DW.setflags(write=False)
+
+    return exp_DW
+
+
+# Integer codes for the atom classification results. Keeping dtype and
+# stype as small integer arrays avoids hashing Python strings in the
+# downstream lookups and keeps the data contiguous.
+_DTYPE_CODE = {
+    "other": 0,
+    "C(sp)": 1,
+    "C(sp2)": 2,
+    "C(sp3)": 3,
+    "N(sp)": 4,
+    "N(sp2)": 5,
+    "N(sp3)": 6,
+    "O(sp2)": 7,
+    "O(sp3)": 8,
+    "F": 9,
+    "Cl": 10,
+    "H(water)": 11,
+    "H(OH)": 12,
+    "H(NH)": 13,
+    "H(other)": 14,
+}
+_STYPE_CODE = {"NHB": 0, "OH": 1, "OT": 2, "COOH": 3}
+
+# {atom type: {bonded atoms: (dtype, stype, dnatr), ...}, ...}
+# This assumes that all atoms are belong to NHB, OT and H(other).
+_ATOM_PROP = {
+    "C": {
+        2: (_DTYPE_CODE["C(sp)"], _STYPE_CODE["NHB"], "NHB"),
+        3: (_DTYPE_CODE["C(sp2)"], _STYPE_CODE["NHB"], "NHB"),
+        4: (_DTYPE_CODE["C(sp3)"], _STYPE_CODE["NHB"], "NHB"),
+    },
+    "O": {
+        1: (_DTYPE_CODE["O(sp2)"], _STYPE_CODE["OT"], "HBOA"),
+        2: (_DTYPE_CODE["O(sp3)"], _STYPE_CODE["OT"], "HBOA"),
+    },
+    "N": {
+        1: (_DTYPE_CODE["N(sp)"], _STYPE_CODE["OT"], "HBOA"),
+        2: (_DTYPE_CODE["N(sp2)"], _STYPE_CODE["OT"], "HBOA"),
+        3: (_DTYPE_CODE["N(sp3)"], _STYPE_CODE["OT"], "HBOA"),
+    },
+    "F": {1: (_DTYPE_CODE["F"], _STYPE_CODE["OT"], "HBOA")},
+    "Cl": {1: (_DTYPE_CODE["Cl"], _STYPE_CODE["NHB"], "NHB")},
+    "H": {1: (_DTYPE_CODE["H(other)"], _STYPE_CODE["NHB"], "NHB")},
+}
+
+
 def _get_atom_type(atom, bond):
     """Get hybridization and sigma profile types for each atom.
 
@@ -517,116 +627,98 @@ def _get_atom_type(atom, bond):
 
     Returns
     -------
-    dtype : list of shape=(num_atom,)
-        The dispersion type for each atom.
-    stype : list of shape=(num_atom,)
-        The hydrogen-bonding type for each atom.
+    dtype : numpy.ndarray of shape=(num_atom,), dtype=uint8
+        The dispersion type code for each atom, see _DTYPE_CODE.
+    stype : numpy.ndarray of shape=(num_atom,), dtype=uint8
+        The hydrogen-bonding type code for each atom, see _STYPE_CODE.
     dnatr : {"NHB", "HBOA", "HBDA", "WATER", "COOH"}
         The dispersive nature of the molecule.
     """
-    dtype = ["other"] * len(atom)  # hybridization type
-    stype = ["NHB"] * len(atom)  # sigma profile type
+    dtype = np.zeros(len(atom), dtype=np.uint8)  # hybridization type, "other"
+    stype = np.zeros(len(atom), dtype=np.uint8)  # sigma profile type, "NHB"
     dnatr = "NHB"  # dispersive nature of molecule
     dntype = set()  # dispersive nature type of atoms
 
-    # {atom type: {bonded atoms: (dtype, stype, dnatr), ...}, ...}
-    # This assumes that all atoms are belong to NHB, OT and H(other).
-    atom_prop = {
-        "C": {
-            2: ("C(sp)", "NHB", "NHB"),
-            3: ("C(sp2)", "NHB", "NHB"),
-            4: ("C(sp3)", "NHB", "NHB"),
-        },
-        "O": {
-            1: ("O(sp2)", "OT", "HBOA"),
-            2: ("O(sp3)", "OT", "HBOA"),
-        },
-        "N": {
-            1: ("N(sp)", "OT", "HBOA"),
-            2: ("N(sp2)", "OT", "HBOA"),
-            3: ("N(sp3)", "OT", "HBOA"),
-        },
-        "F": {1: ("F", "OT", "HBOA")},
-        "Cl": {1: ("Cl", "NHB", "NHB")},
-        "H": {1: ("H(other)", "NHB", "NHB")},
-    }
+    # Precompute the neighbor indices of every atom in one pass
+    nbrs = [np.flatnonzero(bond[i]).tolist() for i in range(len(atom))]
 
     for i, atom_type in enumerate(atom):
-        # Get dictionary of index and atom types bonded with atom i
-        ard_i = {j: atom[j] for j in np.flatnonzero(bond[i])}
+        # Get indices and atom types bonded with atom i
+        nbr_i = nbrs[i]
+        nbr_i_types = [atom[j] for j in nbr_i]
 
         # If the atom is in the difined properties
-        if atom_type in atom_prop:
+        if atom_type in _ATOM_PROP:
             # Get atom types, else get ("Undifined", 0)
-            dtype[i], stype[i], dntype_i = atom_prop[atom_type].get(
-                len(ard_i), ("other", "NHB", "NHB")
+            dtype[i], stype[i], dntype_i = _ATOM_PROP[atom_type].get(
+                len(nbr_i), (_DTYPE_CODE["other"], _STYPE_CODE["NHB"], "NHB")
             )
             dntype.add(dntype_i)
 
         # Find H near N, and renew the types of H
-        if atom_type == "H" and "N" in ard_i.values():
-            dtype[i] = "H(NH)"
-            stype[i] = "OT"
+        if atom_type == "H" and "N" in nbr_i_types:
+            dtype[i] = _DTYPE_CODE["H(NH)"]
+            stype[i] = _STYPE_CODE["OT"]
             dntype.add("HBDA")
 
         # Find H in HF, and renew the types of H
-        if atom_type == "H" and "F" in ard_i.values():
-            stype[i] = "OT"
+        if atom_type == "H" and "F" in nbr_i_types:
+            stype[i] = _STYPE_CODE["OT"]
             dntype.add("HBDA")
 
         # Find atom type for -OH, H2O, and COOH
-        if atom_type == "H" and "O" in ard_i.values():
+        if atom_type == "H" and "O" in nbr_i_types:
             # # Renew the typs of H and O in OH
             # Renew the types of H
-            dtype[i] = "H(OH)"
-            stype[i] = "OH"
+            dtype[i] = _DTYPE_CODE["H(OH)"]
+            stype[i] = _STYPE_CODE["OH"]
 
             # Find the atom index of O in OH
-            j = list(ard_i.keys())[0]
-            ard_j = {k: atom[k] for k in np.flatnonzero(bond[j])}
+            j = nbr_i[0]
+            nbr_j = nbrs[j]
             # Renew the types of O in -OH
-            stype[j] = "OH"
+            stype[j] = _STYPE_CODE["OH"]
             dntype.add("HBDA")
 
             # # Further find H-OH and CO-OH
-            # if the O in -OH has not two bonds, stop searching
-            if len(ard_j) != 2:
-                break
+            # if the O in -OH has not two bonds, stop searching this atom
+            if len(nbr_j) != 2:
+                continue
 
             # Find atom index of neighber of O in -OH, but not H in -OH
-            k = [k for k in ard_j.keys() if k != i][0]
-            ard_k = {m: atom[m] for m in np.flatnonzero(bond[k])}
+            k = [k for k in nbr_j if k != i][0]
+            nbr_k = nbrs[k]
 
             # if atom k is H, that is, if the molecule is water, renew the
-            # dtype of the Hs in H2O and stop searching
+            # dtype of the Hs in H2O and stop searching this atom
             if atom[k] == "H":
-                dtype[i] = "H(water)"
-                dtype[k] = "H(water)"
+                dtype[i] = _DTYPE_CODE["H(water)"]
+                dtype[k] = _DTYPE_CODE["H(water)"]
                 dntype.add("WATER")
-                break
+                continue
 
             # # Further find COOH
             # if the atom k is not the C in part of COOH, stop searching
+            # this atom
             if not (
                 atom[k] == "C"
-                and len(ard_k) == 3
-                and list(ard_k.values()).count("O") == 2
+                and len(nbr_k) == 3
+                and [atom[n] for n in nbr_k].count("O") == 2
             ):
-                break
+                continue
 
             # Find the O, neighber of C in -COH, but not in O in -COH
-            m = [m for m in ard_k.keys() if (m != j and ard_k[m] == "O")][0]
-            ard_m = {n: atom[n] for n in np.flatnonzero(bond[m])}
+            m = [m for m in nbr_k if (m != j and atom[m] == "O")][0]
 
-            # if the atom m is -O-, not =O, stop searching
-            if len(ard_m) != 1:
-                break
+            # if the atom m is -O-, not =O, stop searching this atom
+            if len(nbrs[m]) != 1:
+                continue
 
             # Renew i(H), j(O), k(C) and m(O) as the part of COOH
             dntype.add("COOH")
-            stype[i] = "COOH"
-            stype[j] = "COOH"
-            stype[m] = "COOH"
+            stype[i] = _STYPE_CODE["COOH"]
+            stype[j] = _STYPE_CODE["COOH"]
+            stype[m] = _STYPE_CODE["COOH"]
 
     # find the dispersive nature of the molecule
     if "HBOA" in dntype:
@@ -641,64 +733,83 @@ def _get_atom_type(atom, bond):
     return dtype, stype, dnatr
 
 
+# dispersive parameters, tabulated by dispersion type code; "other" has no
+# parameter and is left as nan
+_DSP_PARAM = {
+    "C(sp3)": 115.7023,
+    "C(sp2)": 117.4650,
+    "C(sp)": 66.0691,
+    "N(sp3)": 15.4901,
+    "N(sp2)": 84.6268,
+    "N(sp)": 109.6621,
+    "O(sp3)": 95.6184,  # -O-
+    "O(sp2)": -11.0549,  # =O
+    "F": 52.9318,
+    "Cl": 104.2534,
+    "H(water)": 58.3301,
+    "H(OH)": 19.3477,
+    "H(NH)": 141.1709,
+    "H(other)": 0,
+}
+_DSP_TABLE = np.full(len(_DTYPE_CODE), np.nan)
+for _name, _value in _DSP_PARAM.items():
+    _DSP_TABLE[_DTYPE_CODE[_name]] = _value
+del _name, _value
+
+
 def _get_dsp(dtype):
     """
     Get the dispersive nature of the molecule.
 
     Parameters
     ----------
-    dtype : list of shape=(num_atom,)
-        The dispersion type for each atom.
+    dtype : numpy.ndarray of shape=(num_atom,), dtype=uint8
+        The dispersion type code for each atom, see _DTYPE_CODE.
 
     Returns
     -------
     ek : float
         Dispersive parameter.
     """
-    # dispersive parameters
-    ddict = {
-        "C(sp3)": 115.7023,
-        "C(sp2)": 117.4650,
-        "C(sp)": 66.0691,
-        "N(sp3)": 15.4901,
-        "N(sp2)": 84.6268,
-        "N(sp)": 109.6621,
-        "O(sp3)": 95.6184,  # -O-
-        "O(sp2)": -11.0549,  # =O
-        "F": 52.9318,
-        "Cl": 104.2534,
-        "H(water)": 58.3301,
-        "H(OH)": 19.3477,
-        "H(NH)": 141.1709,
-        "H(other)": 0,
-    }
+    # gather the atomic parameters; nan marks undifined dispersion types,
+    # which make the molecular parameter undefined
+    ek = _DSP_TABLE[dtype]
+    if np.any(np.isnan(ek)):
 
-    # calculate the dispersive parameter of the molecule
-    ek = np.vectorize(ddict.get)(dtype)
-    if None in ek:
+        return None
+
+    # calculate the dispersive parameter of the molecule as the mean over
+    # the atoms with nonzero parameters
+    num_nonzero = np.count_nonzero(ek)
+    if num_nonzero == 0:
 
         return None
-    else:
-        ek = np.sum(ek) / np.count_nonzero(ek)
 
-    return ek
+    return np.sum(ek) / num_nonzero
 
 
-def retrieve_sigma_profile(file_dir) -> dict:
-    opened_file = open(file_dir, "r")
-    line = opened_file.readline()
-    if "COSMO Results from DMol3" in line:  # Material Studio 2017
-        area, volume, atoms, coord, seg = _get_cosmo_from_ms(file_dir)
-    elif "text" in line:  # VT 2006, UD 2020, or KU 2023 database
-        area, volume, atoms, coord, seg = _get_cosmo_from_not_ms(file_dir)
-    else:
-        raise ValueError(f"The file {file_dir} is not interpreted as cosmo file.")
+@functools.lru_cache(maxsize=4096)
+def _retrieve_sigma_profile_cached(file_dir):
+    """Parse and classify a cosmo file, memoized on the file path.
+
+    Flash and VLE loops retrieve the same components over and over; caching
+    here skips the file parsing, bond perception, and atom classification
+    on every call after the first.
+    """
+    area, volume, atoms, coord, seg = get_cosmo(file_dir)
 
     bonds = _get_bond(atoms, coord)
     dtype, stype, dnatr = _get_atom_type(atoms, bonds)
-    sigma_profiles = _get_sigma(atoms, seg, stype).reshape(1, 4, 51)
+    sigma_profiles = _get_sigma(atoms, seg, stype)  # shape=(num_sp, 51)
+    sigma_profiles.setflags(write=False)  # shared between calls
     ek = _get_dsp(dtype)
 
+    return area, volume, sigma_profiles, ek, dnatr
+
+
+def retrieve_sigma_profile(file_dir) -> dict:
+    area, volume, sigma_profiles, ek, dnatr = _retrieve_sigma_profile_cached(file_dir)
+
     return {
         "area": area,
         "volume": volume,
@@ -720,22 +831,195 @@ def cal_ln_gam_comb(A, V, x):
     ln_gam_comb : numpy.ndarray of shape=(num_comp,)
         Combinatory activity coefficients of components.
     """
+    # a pure component behaves ideally by definition
+    if len(x) == 1:
+
+        return np.zeros(1)
+
     # calculate normalized areas and volumes
     q = A / _q0
     r = V / _r0
     L = (_z / 2) * (r - q) - (r - 1)
 
-    theta = q / np.sum(x * q)
-    phi = r / np.sum(x * r)
+    # share the composition-weighted products between the reductions
+    sum_xq = np.sum(x * q)
+    sum_xr = np.sum(x * r)
+
+    phi = r / sum_xr
+    theta_over_phi = q * sum_xr / (r * sum_xq)
 
     # calcualte combinatory activity coefficients
     ln_gam_comb = (
-        np.log(phi) + _z * q * np.log(theta / phi) / 2 + L - phi * np.sum(x * L)
+        np.log(phi) + _z * q * np.log(theta_over_phi) / 2 + L - phi * np.sum(x * L)
     )
 
     return ln_gam_comb
 
 
+def _make_gam_fixed_point(num_comp):
+    """Build the segment activity fixed-point iteration for num_comp.
+
+    The iteration is written with explicit loops and preallocated buffers so
+    that numba can compile it to a single tight kernel; without numba the
+    vectorized fallback below is used instead. The A^(+) tensors are never
+    materialized: their elements exp_DW[s, t, m, n] * psig[s, n, i] are
+    formed on the fly inside the contraction, so the kernel only streams
+    the small exp_DW and psig arrays.
+
+    The contracted charge axis of exp_DW, psig, psig_mix, Gam, and Gam_mix
+    may be zero-padded beyond the 51-point grid so that its length divides
+    the SIMD width; the padded entries contribute nothing to the sums and
+    are never updated. The component axis of psig and Gam is last
+    (stride-1), so each exp_DW element is loaded once and reused across
+    all components in the innermost loop.
+
+    Closing over num_comp makes it a compile-time constant for numba, so
+    the innermost component loops are unrolled and their bounds checks drop
+    out; binary mixtures, by far the commonest case, get a fully branchless
+    kernel. Compiled kernels are cached per component count by
+    _get_gam_fixed_point.
+
+    Parameters
+    ----------
+    num_comp : int
+        The number of components the kernel is specialized for.
+
+    Returns
+    -------
+    _gam_fixed_point : callable
+        Kernel taking (exp_DW, psig, psig_mix, Gam, Gam_mix), where exp_DW
+        has shape=(num_sp, num_sp, 51, num_n), psig and Gam have
+        shape=(num_sp, num_n, num_comp), and psig_mix and Gam_mix have
+        shape=(num_sp, num_n). It returns the converged Gam and Gam_mix
+        and a bool telling whether the iteration converged within 500
+        steps.
+    """
+
+    def _gam_fixed_point(exp_DW, psig, psig_mix, Gam, Gam_mix):
+        num_sp = exp_DW.shape[0]
+        num_m = exp_DW.shape[2]  # length of the charge grid
+        num_n = exp_DW.shape[3]  # contracted axis, possibly padded for SIMD
+        Gam_new = np.copy(Gam)
+        Gam_mix_new = np.copy(Gam_mix)
+        acc = np.empty(num_comp, dtype=exp_DW.dtype)
+
+        for _ in range(500):
+            # Update Gam, accumulating the convergence measure in one pass
+            diff = 0.0
+            for t in range(num_sp):
+                for m in range(num_m):
+                    for i in range(num_comp):
+                        acc[i] = 0.0
+                    for s in range(num_sp):
+                        for n in range(num_n):
+                            w = exp_DW[s, t, m, n]
+                            for i in range(num_comp):
+                                acc[i] += w * psig[s, n, i] * Gam[s, n, i]
+                    for i in range(num_comp):
+                        # damp the update by averaging with the old value;
+                        # the undamped iteration oscillates
+                        new = 0.5 * (Gam[t, m, i] + 1.0 / acc[i])
+                        d = new - Gam[t, m, i]
+                        diff += d * d
+                        Gam_new[t, m, i] = new
+
+            # Update Gam_mix likewise
+            diff_mix = 0.0
+            for t in range(num_sp):
+                for m in range(num_m):
+                    acc_mix = 0.0
+                    for s in range(num_sp):
+                        for n in range(num_n):
+                            acc_mix += (
+                                exp_DW[s, t, m, n] * psig_mix[s, n] * Gam_mix[s, n]
+                            )
+                    new = 0.5 * (Gam_mix[t, m] + 1.0 / acc_mix)
+                    d = new - Gam_mix[t, m]
+                    diff_mix += d * d
+                    Gam_mix_new[t, m] = new
+
+            # Swap buffers instead of allocating new arrays
+            Gam, Gam_new = Gam_new, Gam
+            Gam_mix, Gam_mix_new = Gam_mix_new, Gam_mix
+
+            # check convergence
+            if diff <= 1e-6 and diff_mix <= 1e-6:
+                return Gam, Gam_mix, True
+
+        return Gam, Gam_mix, False
+
+    return _gam_fixed_point
+
+
+def _gam_fixed_point_numpy(exp_DW, psig, psig_mix, Gam, Gam_mix):
+    """Vectorized fallback of the fixed-point iteration without numba."""
+    # Find the optimal contraction orders once; the shapes are fixed over
+    # the iteration, so the paths are reused on every step.
+    path = np.einsum_path(
+        "stmn,isn,isn->itm", exp_DW, psig, Gam, optimize="optimal"
+    )[0]
+    path_mix = np.einsum_path(
+        "stmn,sn,sn->tm", exp_DW, psig_mix, Gam_mix, optimize="optimal"
+    )[0]
+
+    # preallocate the update and difference buffers once and reuse them on
+    # every iteration instead of allocating fresh temporaries
+    Gam_new = np.empty_like(Gam)
+    Gam_mix_new = np.empty_like(Gam_mix)
+    d = np.empty_like(Gam)
+    d_mix = np.empty_like(Gam_mix)
+
+    for _ in range(500):
+        np.einsum(
+            "stmn,isn,isn->itm", exp_DW, psig, Gam, optimize=path, out=Gam_new
+        )
+        np.divide(1, Gam_new, out=Gam_new)
+        np.einsum(
+            "stmn,sn,sn->tm", exp_DW, psig_mix, Gam_mix, optimize=path_mix,
+            out=Gam_mix_new,
+        )
+        np.divide(1, Gam_mix_new, out=Gam_mix_new)
+
+        # damp the update by averaging with the old value; the undamped
+        # iteration oscillates
+        np.add(Gam_new, Gam, out=Gam_new)
+        Gam_new *= 0.5
+        np.add(Gam_mix_new, Gam_mix, out=Gam_mix_new)
+        Gam_mix_new *= 0.5
+
+        # check convergence with scalar dot products over the reused
+        # difference buffers
+        np.subtract(Gam_new, Gam, out=d)
+        np.subtract(Gam_mix_new, Gam_mix, out=d_mix)
+        diff = d.ravel() @ d.ravel()
+        diff_mix = d_mix.ravel() @ d_mix.ravel()
+
+        # swap buffers instead of allocating new arrays
+        Gam, Gam_new = Gam_new, Gam
+        Gam_mix, Gam_mix_new = Gam_mix_new, Gam_mix
+
+        if diff <= 1e-6 and diff_mix <= 1e-6:
+            return Gam, Gam_mix, True
+
+    return Gam, Gam_mix, False
+
+
+if njit is not None:
+
+    @functools.lru_cache(maxsize=32)
+    def _get_gam_fixed_point(num_comp):
+        """Compile and cache the fixed-point kernel per component count."""
+        # numba cannot disk-cache kernels with closure constants, so the
+        # compiled specializations live for the process lifetime only
+        return njit(fastmath=True)(_make_gam_fixed_point(num_comp))
+
+else:
+
+    def _get_gam_fixed_point(num_comp):
+        """Return the vectorized fallback; it needs no specialization."""
+        return _gam_fixed_point_numpy
+
+
 def cal_ln_gam_res(A, psigA, x, T):
     """
     Calculate residual activity coefficients.
@@ -749,55 +1033,80 @@ def cal_ln_gam_res(A, psigA, x, T):
     ln_gam_res : numpy.ndarray of shape=(num_comp,)
         Residual activity coefficients of components.
     """
+    # a pure component behaves ideally by definition; skip the iteration
+    if len(x) == 1:
+
+        return np.zeros(1)
+
     # calculate intermediate terms
-    psig = np.einsum("itm,i->itm", psigA, 1 / A)
-    psig_mix = np.einsum("i,itm->tm", x, psigA) / np.sum(x * A)
+    psig = np.einsum("itm,i->itm", psigA, 1 / A, optimize="optimal")
+    psig_mix = np.einsum("i,itm->tm", x, psigA, optimize="optimal") / np.sum(x * A)
 
-    exp_DW = np.exp(-_cal_DW(T) / _R / T)
+    # run the iteration in the reduced precision of _DTYPE
+    exp_DW = _cal_exp_DW(T).astype(_DTYPE)
+    psig = psig.astype(_DTYPE)
+    psig_mix = psig_mix.astype(_DTYPE)
 
-    A_plus = np.einsum("stmn,isn->istmn", exp_DW, psig)  # A^(+)
-    A_plus_mix = np.einsum("stmn,sn->stmn", exp_DW, psig_mix)  # A^(+)_mix
+    num_comp, num_sp, num_sig = psig.shape
 
     # calculate the segment activity coefficients
-    Gam = np.ones(np.shape(psig))
-    Gam_mix = np.ones(np.shape(psig_mix))
-    diff = 1
-
-    for _ in range(500):
-        Gam_old = np.array(Gam)
-        Gam_mix_old = np.array(Gam_mix)
-
-        # Update Gam element-wise
-        for i in range(Gam.shape[0]):
-            for t in range(Gam.shape[1]):
-                for m in range(Gam.shape[2]):
-                    Gam[i, t, m] = 1 / np.einsum(
-                        "sn,sn->", A_plus[i, :, t, m, :], Gam[i, :, :]
-                    )
-
-        # Update Gam_mix element-wise
-        for t in range(Gam_mix.shape[0]):
-            for m in range(Gam_mix.shape[1]):
-                Gam_mix[t, m] = 1 / np.einsum(
-                    "sn,sn->", A_plus_mix[:, t, m, :], Gam_mix[:, :]
-                )
+    if njit is not None:
+        # zero-pad the contracted charge axis to the SIMD-friendly width
+        # and put the component axis last so the kernel reuses each exp_DW
+        # element across all components; the padded profile entries
+        # contribute nothing to the sums and the padded segment activities
+        # are never updated
+        pad_n = _N_SIG_PAD - num_sig
+        exp_DW = np.pad(exp_DW, ((0, 0), (0, 0), (0, 0), (0, pad_n)))
+        psig = np.ascontiguousarray(
+            np.moveaxis(np.pad(psig, ((0, 0), (0, 0), (0, pad_n))), 0, 2)
+        )
+        psig_mix = np.pad(psig_mix, ((0, 0), (0, pad_n)))
+
+        Gam = np.ones((num_sp, _N_SIG_PAD, num_comp), dtype=_DTYPE)
+        Gam_mix = np.ones((num_sp, _N_SIG_PAD), dtype=_DTYPE)
+
+        Gam, Gam_mix, converged = _get_gam_fixed_point(num_comp)(
+            exp_DW, psig, psig_mix, Gam, Gam_mix
+        )
+        Gam = np.moveaxis(Gam, 2, 0)  # back to the (i, t, m) layout
+    else:
+        Gam = np.ones(np.shape(psig), dtype=_DTYPE)
+        Gam_mix = np.ones(np.shape(psig_mix), dtype=_DTYPE)
 
-        # check convergence
-        diff = np.sum((Gam - Gam_old) ** 2)
-        diff_mix = np.sum((Gam_mix - Gam_mix_old) ** 2)
+        Gam, Gam_mix, converged = _get_gam_fixed_point(num_comp)(
+            exp_DW, psig, psig_mix, Gam, Gam_mix
+        )
 
-        if diff <= 1e-6 and diff_mix <= 1e-6:
-            break
-    else:
+    if not converged:
         raise Exception("Converge failed")
 
-    # calculate residual activity coefficients
-    Gam_part = np.log(Gam_mix) - np.log(Gam)
-    ln_gam_res = np.einsum("itm,itm->i", psigA, Gam_part) / _aeff
+    # drop the padded charge entries again
+    Gam = Gam[..., :num_sig]
+    Gam_mix = Gam_mix[..., :num_sig]
+
+    # calculate residual activity coefficients, upcasting back to float64
+    Gam_part = np.log(Gam_mix, dtype=np.float64) - np.log(Gam, dtype=np.float64)
+    ln_gam_res = np.einsum("itm,itm->i", psigA, Gam_part, optimize="optimal") / _aeff
 
     return ln_gam_res
 
 
+# Dispersive nature codes and the interaction parameter table. The pairs
+# listed below interact with w = -0.27027, all other pairs with +0.27027.
+_DNATR_CODE = {"NHB": 0, "HBOA": 1, "HBDA": 2, "WATER": 3, "COOH": 4}
+_W_TABLE = np.full((5, 5), 0.27027)
+for _natr_i, _natr_j in (
+    ("WATER", "HBOA"),
+    ("COOH", "NHB"),
+    ("COOH", "HBDA"),
+    ("WATER", "COOH"),
+):
+    _i, _j = _DNATR_CODE[_natr_i], _DNATR_CODE[_natr_j]
+    _W_TABLE[_i, _j] = _W_TABLE[_j, _i] = -0.27027
+del _natr_i, _natr_j, _i, _j
+
+
 def cal_ln_gam_dsp(x, ek, dnatr):
     """
     Calculate dispersive activity coefficients.
@@ -813,45 +1122,30 @@ def cal_ln_gam_dsp(x, ek, dnatr):
     """
     num_mol = len(x)
 
-    if None in ek:
+    # a pure component behaves ideally by definition
+    if num_mol == 1:
 
-        return np.zeros(num_mol)
+        return np.zeros(1)
 
-    ekT = ek.reshape(-1, 1)
+    ek = np.asarray(ek, dtype=np.float64)
 
-    # check if dispersion activity coefficients are applicable
-    if None in ek or None in dnatr:
-        ln_gam_dsp = np.array([0] * num_mol)
+    # check if dispersion activity coefficients are applicable; missing
+    # dispersive parameters are carried as nan
+    if np.any(np.isnan(ek)) or None in dnatr:
 
-        return ln_gam_dsp
-    elif True in np.isnan(ek):
-        ln_gam_dsp = np.array([0] * num_mol)
+        return np.zeros(num_mol)
 
-        return ln_gam_dsp
+    ekT = ek.reshape(-1, 1)
 
     # calculate interaction parameters
-    w = np.ones((num_mol, num_mol)) * 0.27027
-    wpair = [
-        {"WATER", "HBOA"},
-        {"COOH", "NHB"},
-        {"COOH", "HBDA"},
-        {"WATER", "COOH"},
-    ]
-    for i in range(num_mol):
-        for j in range(i):
-            if {dnatr[i], dnatr[j]} in wpair:
-                w[i][j] = w[j][i] = -0.27027
+    codes = np.array([_DNATR_CODE[natr] for natr in dnatr])
+    w = _W_TABLE[codes[:, None], codes[None, :]]
 
     A = w * (0.5 * (ek + ekT) - np.sqrt(ek * ekT))  # not area
+    np.fill_diagonal(A, 0)  # self-interaction terms are excluded
 
     # calculate dispersive activity coefficients
-    ln_gam_dsp = np.zeros(num_mol)
-    for i in range(num_mol):
-        for j in range(num_mol):
-            if i != j:
-                ln_gam_dsp[i] = ln_gam_dsp[i] + x[j] * A[i, j]
-            if j > i:
-                ln_gam_dsp[i] = ln_gam_dsp[i] - x[i] * x[j] * A[i, j]
+    ln_gam_dsp = A @ x - x * (np.triu(A, 1) @ x)
 
     return ln_gam_dsp
 
@@ -869,17 +1163,23 @@ def calculate_gamma(chemical_profiles: list, x: list, T: float) -> list:
     gam : list of shape=(num_comp,)
         Activity coefficients of components.
     """
-    areas = np.array([])
-    volumes = np.array([])
-    psigA = np.array([]).reshape(0, 4, 51)
-    eks = np.array([])
-    natrs = []
-    for chemical_profile in chemical_profiles:
-        areas = np.append(areas, chemical_profile["area"])
-        volumes = np.append(volumes, chemical_profile["volume"])
-        psigA = np.vstack((psigA, chemical_profile["sigma_profiles"]))
-        eks = np.append(eks, chemical_profile["ek"])
-        natrs.append(chemical_profile["natr"])
+    num_comp = len(chemical_profiles)
+    x = np.asarray(x, dtype=np.float64)
+
+    # Gather component properties into preallocated arrays; missing
+    # dispersive parameters are carried as nan.
+    areas = np.empty(num_comp)
+    volumes = np.empty(num_comp)
+    psigA = np.empty((num_comp, 4, 51))
+    eks = np.empty(num_comp)
+    natrs = [None] * num_comp
+    for i, chemical_profile in enumerate(chemical_profiles):
+        areas[i] = chemical_profile["area"]
+        volumes[i] = chemical_profile["volume"]
+        psigA[i] = np.reshape(chemical_profile["sigma_profiles"], (4, 51))
+        ek = chemical_profile["ek"]
+        eks[i] = np.nan if ek is None else ek
+        natrs[i] = chemical_profile["natr"]
 
     ln_gam_comb = cal_ln_gam_comb(areas, volumes, x)
     ln_gam_res = cal_ln_gam_res(areas, psigA, x, T)